@@ -1,8 +1,16 @@
+import hmac
+import re
+import sqlite3
 import time
-import json
+import asyncio
+import multiprocessing
+import orjson
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -24,6 +32,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# CSS selectors, built once at import time instead of per post
+POST_SELECTORS = (
+    'div.feed-shared-update-v2',
+    'div.feed-shared-update',
+    'div.feed-shared-article',
+    'div.feed-shared-external-video',
+    'div.feed-shared-text'
+)
+POST_SEL = ', '.join(POST_SELECTORS)
+POST_CONTENT_SEL = 'span.break-words, div.feed-shared-update-v2__description'
+REACTIONS_SEL = 'span.social-details-social-counts__reactions-count'
+SOCIAL_COUNTS_SEL = 'span[aria-hidden="true"]'
+IMG_SELECTORS = ('img.feed-shared-image__image', 'img.feed-shared-image__img')
+VIDEO_SELECTORS = ('video.feed-shared-video__video', 'video.feed-shared-video__player')
+IMG_SEL = ', '.join(IMG_SELECTORS)
+COMMENTS_BUTTON_SEL = 'button[aria-label*="comments"]'
+LOAD_MORE_COMMENTS_SEL = 'button[class*="load-more-comments-button"]'
+COMMENT_ITEM_SEL = 'div[class*="comments-comment-item"]'
+COMMENT_TEXT_SEL = 'span.comments-comment-item__main-content'
+COMMENT_LIKES_SEL = 'button.comments-comment-social-bar__reactions-count span'
+
+# Leading number in a social count such as "1,234 comments"
+DIGITS_RE = re.compile(r'(\d[\d,]*)')
+
+# Locator tuples for explicit waits
+GLOBAL_NAV_LOCATOR = (By.CSS_SELECTOR, '#global-nav')
+POSTS_LOADED_LOCATOR = (By.CSS_SELECTOR, 'div.feed-shared-update-v2, div.scaffold-finalize')
+SEE_MORE_LOCATOR = (By.CSS_SELECTOR, 'button.feed-shared-inline-show-more-text__see-more-less-toggle')
+COMMENT_ITEM_LOCATOR = (By.CSS_SELECTOR, COMMENT_ITEM_SEL)
+
+# True while any image in the post (arguments[0]) still holds an inline lazy-load placeholder
+PENDING_IMAGES_JS = "return Array.from(arguments[0].querySelectorAll(arguments[1]), i => i.src).some(src => src.startsWith('data:'));"
+# Jumps the post into view and reports pending images in the same round-trip
+SCROLL_TO_POST_JS = "arguments[0].scrollIntoView({block: 'center'}); " + PENDING_IMAGES_JS
+
+# Selectors handed to the in-page extraction helpers when they are installed
+EXTRACT_SELECTORS = {
+    'content': POST_CONTENT_SEL,
+    'likes': REACTIONS_SEL,
+    'socials': SOCIAL_COUNTS_SEL,
+    'imgs': IMG_SEL,
+    'videos': ', '.join(VIDEO_SELECTORS),
+    'comments': COMMENT_ITEM_SEL,
+    'commentText': COMMENT_TEXT_SEL,
+    'commentLikes': COMMENT_LIKES_SEL,
+}
+
+# In-page helpers that gather a post's fields, or its comments, in a single driver round-trip.
+# Text is read with innerText and trimmed in the page, avoiding a WebDriver text call per element.
+EXTRACT_HELPERS_JS = """
+const sel = arguments[0];
+// One compound query per media type, skipping empty and inline placeholder srcs
+const mediaUrls = (el, selector) => Array.from(el.querySelectorAll(selector), m => m.src)
+    .filter(src => src && !src.startsWith('data:'));
+window.__extractPost = function(el) {
+    const content = el.querySelector(sel.content);
+    const likes = el.querySelector(sel.likes);
+    return {
+        text: content ? content.innerText.trim() : null,
+        likes: likes ? likes.innerText.trim() : null,
+        // Only spans that can hold a comment or share count are sent back
+        socials: Array.from(el.querySelectorAll(sel.socials), s => s.innerText.trim())
+            .filter(text => /comment|share|repost/i.test(text)),
+        imgs: mediaUrls(el, sel.imgs),
+        videos: mediaUrls(el, sel.videos)
+    };
+};
+window.__extractComments = function(el, limit) {
+    const comments = [];
+    for (const item of Array.from(el.querySelectorAll(sel.comments)).slice(0, limit)) {
+        const text = item.querySelector(sel.commentText);
+        if (!text) continue;
+        const likes = item.querySelector(sel.commentLikes);
+        comments.push({
+            comment_text: text.innerText.trim(),
+            likes: likes ? likes.innerText.trim() : '0'
+        });
+    }
+    return comments;
+};
+"""
+
+# Ad, tracking and telemetry requests dropped at the protocol layer; none of them carry post data
+BLOCKED_URL_PATTERNS = [
+    '*ads.linkedin.com*',
+    '*doubleclick.net*',
+    '*google-analytics.com*',
+    '*/li/track*',
+    '*beacon*'
+]
+
+# SQLite file used for the post cache when a request sets use_cache
+CACHE_PATH = "linkedin_cache.db"
+
+# Live /scrape browser sessions kept at most, and how long an unused one is kept (seconds)
+MAX_SESSIONS = 4
+SESSION_IDLE_TIMEOUT = 30 * 60
+
+# Number of worker processes (one browser each) used by /scrape_batch
+BATCH_WORKERS = 4
+
 app = FastAPI(title="LinkedIn Scraper API")
 
 class ScrapeRequest(BaseModel):
@@ -34,6 +143,17 @@ class ScrapeRequest(BaseModel):
     num_scrolls: int = 12
     scroll_pause: float = 2.5
     max_comments: int = 15
+    use_cache: bool = False
+
+class BatchScrapeRequest(BaseModel):
+    email: str
+    password: str
+    urls: List[str]
+    headless: bool = True
+    num_scrolls: int = 12
+    scroll_pause: float = 2.5
+    max_comments: int = 15
+    use_cache: bool = False
 
 class LinkedInScraper:
     def __init__(
@@ -44,7 +164,8 @@ class LinkedInScraper:
         window_size: tuple = (1200, 900),
         num_scrolls: int = 12,
         scroll_pause: float = 2.5,
-        max_comments: int = 15
+        max_comments: int = 15,
+        cache_path: Optional[str] = None
     ):
         """
         Initialize the LinkedIn Scraper with configuration parameters.
@@ -57,6 +178,7 @@ class LinkedInScraper:
             num_scrolls (int): Number of times to scroll the page
             scroll_pause (float): Time to pause between scrolls
             max_comments (int): Maximum number of comments to extract per post
+            cache_path (Optional[str]): SQLite file caching scraped posts between runs; None (the default) disables it
         """
         self.email = email
         self.password = password
@@ -65,13 +187,52 @@ class LinkedInScraper:
         self.max_comments = max_comments
         self.browser = None
         
+        # Posts scraped on earlier runs, keyed by their data-urn and comment limit
+        self.cache = None
+        self.cache_path = None
+        self.use_cache(cache_path)
+        
         # Configure Chrome options
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless")
         chrome_options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
+        # Return from get() at DOMContentLoaded; explicit waits cover the elements we need
+        chrome_options.page_load_strategy = 'eager'
+        # Skip downloading media; the src attributes we scrape stay in the DOM
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
         self.chrome_options = chrome_options
 
+    def use_cache(self, cache_path: Optional[str]):
+        """
+        Switch the post cache to another SQLite file.
+        
+        Cached posts keep the counts and comments from when they were first scraped,
+        so only enable this when stale engagement data is acceptable.
+        
+        Args:
+            cache_path (Optional[str]): SQLite file to cache posts in, or None to disable caching
+        """
+        if cache_path == self.cache_path:
+            return
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+        self.cache_path = cache_path
+        if cache_path:
+            self.cache = sqlite3.connect(cache_path, timeout=30, check_same_thread=False)
+            self.cache.execute(
+                "CREATE TABLE IF NOT EXISTS cached_posts ("
+                "urn TEXT NOT NULL, max_comments INTEGER NOT NULL, data BLOB NOT NULL, "
+                "PRIMARY KEY (urn, max_comments))"
+            )
+            self.cache.commit()
+
     def login(self) -> bool:
         """
         Log in to LinkedIn.
@@ -81,10 +242,15 @@ class LinkedInScraper:
         """
         try:
             self.browser = webdriver.Chrome(options=self.chrome_options)
+            # Optional lookups must fail immediately; required elements use explicit waits
+            self.browser.implicitly_wait(0)
+            self.browser.execute_cdp_cmd('Network.enable', {})
+            self.browser.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
             self.browser.get("https://www.linkedin.com/login")
-            time.sleep(2)
             
-            email_input = self.browser.find_element(By.ID, "username")
+            email_input = WebDriverWait(self.browser, 10).until(
+                EC.presence_of_element_located((By.ID, "username"))
+            )
             password_input = self.browser.find_element(By.ID, "password")
             
             email_input.send_keys(self.email)
@@ -92,12 +258,32 @@ class LinkedInScraper:
             password_input.send_keys(Keys.RETURN)
             
             # Wait for login to complete
-            time.sleep(5)
+            WebDriverWait(self.browser, 15).until(EC.any_of(
+                EC.url_contains("/feed"),
+                EC.presence_of_element_located(GLOBAL_NAV_LOCATOR)
+            ))
             return True
         except Exception as e:
             print(f"Login failed: {str(e)}")
             return False
 
+    def is_logged_in(self) -> bool:
+        """
+        Check that the browser is still open and signed in to LinkedIn.
+        
+        Returns:
+            bool: True if the feed loads with the signed-in navigation bar, False otherwise
+        """
+        if not self.browser:
+            return False
+        try:
+            self.browser.get("https://www.linkedin.com/feed/")
+            WebDriverWait(self.browser, 10).until(EC.presence_of_element_located(GLOBAL_NAV_LOCATOR))
+            return True
+        except Exception as e:
+            logger.info(f"LinkedIn session is no longer valid: {str(e)}")
+            return False
+
     def scrape_company_posts(self, company_url: str, auto_save: bool = True) -> Dict:
         """
         Scrape posts from a company's LinkedIn page.
@@ -133,67 +319,65 @@ class LinkedInScraper:
             
         logger.info(f"Navigating to company posts page: {company_url}")
         self.browser.get(company_url)
-        time.sleep(4)
+        try:
+            WebDriverWait(self.browser, 10).until(
+                EC.presence_of_element_located(POSTS_LOADED_LOCATOR)
+            )
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for posts to render on {company_url}")
+
+        # Install the extraction helpers on the freshly loaded page
+        self.browser.execute_script(EXTRACT_HELPERS_JS, EXTRACT_SELECTORS)
 
         # Scroll to load more posts
         logger.info(f"Scrolling page {self.num_scrolls} times to load posts...")
-        last_height = self.browser.execute_script("return document.body.scrollHeight")
+        last_height = None
         for i in range(self.num_scrolls):
-            # Scroll down
-            self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(self.scroll_pause)
-            
-            # Calculate new scroll height and compare with last scroll height
-            new_height = self.browser.execute_script("return document.body.scrollHeight")
+            # Scroll down and read the height grown by the previous scroll in a single driver call
+            new_height = self.browser.execute_script(
+                "window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;"
+            )
             if new_height == last_height:
                 # If heights are the same, we've reached the bottom
                 break
             last_height = new_height
+            time.sleep(self.scroll_pause)
 
-        # Wait for posts to load
-        time.sleep(2)
-
-        # Find posts with multiple selectors
+        # Find posts with all selectors in one query; the result is unique and in document order
         logger.info("Finding post elements...")
-        post_elements = []
-        
-        # Try different selectors
-        selectors = [
-            'div.feed-shared-update-v2',
-            'div.feed-shared-update',
-            'div.feed-shared-article',
-            'div.feed-shared-external-video',
-            'div.feed-shared-text'
-        ]
-        
-        for selector in selectors:
-            elements = self.browser.find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                post_elements.extend(elements)
-                logger.debug(f"Found {len(elements)} posts with selector: {selector}")
-
-        # Remove duplicates while preserving order
-        seen = set()
-        post_elements = [x for x in post_elements if not (x in seen or seen.add(x))]
+        post_elements = self.browser.find_elements(By.CSS_SELECTOR, POST_SEL)
 
         logger.info(f"Found {len(post_elements)} posts for {company_name}")
         
         # Process each post
         for idx, post in enumerate(post_elements, 1):
             try:
-                # Scroll the post into view first
-                self.browser.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", post)
-                time.sleep(2)  # Wait for scroll to complete
+                # Reuse the post if an earlier run already scraped it; the URN is only read when caching
+                urn = post.get_dom_attribute('data-urn') if self.cache else None
+                post_data = self._get_cached_post(urn)
+                if post_data is not None:
+                    result["posts"].append(post_data)
+                    logger.info(f"Loaded post {idx}/{len(post_elements)} from cache")
+                    continue
+                
+                # Bring the post into view; only wait when its images are still lazy-load placeholders
+                if self.browser.execute_script(SCROLL_TO_POST_JS, post, IMG_SEL):
+                    try:
+                        WebDriverWait(self.browser, 2).until_not(
+                            lambda browser: browser.execute_script(PENDING_IMAGES_JS, post, IMG_SEL)
+                        )
+                    except TimeoutException:
+                        # Placeholder srcs are dropped during extraction
+                        pass
                 
                 # Get post data
-                post_data = self._extract_post_data(post, idx)
+                post_data, complete = self._extract_post_data(post, idx)
+                # Partial extractions are returned but not cached, so the next run retries them
+                if complete:
+                    self._cache_post(urn, post_data)
                 result["posts"].append(post_data)
                 logger.info(f"Successfully processed post {idx}/{len(post_elements)}")
                 
-                # Scroll a bit more to ensure next post is in view
-                self.browser.execute_script("window.scrollBy(0, 100);")
-                time.sleep(1)
-                
             except Exception as e:
                 logger.error(f"Error processing post {idx}: {str(e)}")
                 continue
@@ -205,107 +389,107 @@ class LinkedInScraper:
             
         return result
 
-    def _extract_post_data(self, post, idx: int) -> Dict:
-        """Helper method to extract data from a single post."""
+    def _extract_post_data(self, post, idx: int) -> Tuple[Dict, bool]:
+        """Helper method to extract data from a single post, and whether every field was extracted."""
         post_data = {}
         
+        # Expand truncated post text; most posts have no button, so look it up without waiting
+        more_buttons = post.find_elements(*SEE_MORE_LOCATOR)
+        if more_buttons:
+            self.browser.execute_script("arguments[0].click();", more_buttons[0])
+
+        # Gather text, counts and media in one round-trip
+        fields = self.browser.execute_script("return window.__extractPost(arguments[0]);", post)
+
         # Extract post text
-        try:
-            try:
-                more_button = WebDriverWait(post, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'button.feed-shared-inline-show-more-text__see-more-less-toggle'))
-                )
-                self.browser.execute_script("arguments[0].click();", more_button)
-                time.sleep(1)
-            except (TimeoutException, NoSuchElementException):
-                pass
-
-            content_elem = post.find_element(By.CSS_SELECTOR, 'span.break-words, div.feed-shared-update-v2__description')
-            post_data['post_text'] = content_elem.text.strip()
-        except NoSuchElementException:
+        if fields['text'] is not None:
+            post_data['post_text'] = fields['text']
+        else:
             post_data['post_text'] = "[Could not extract post content]"
 
         # Extract likes
-        try:
-            likes_elem = post.find_element(By.CSS_SELECTOR, 'span.social-details-social-counts__reactions-count')
-            post_data['likes'] = likes_elem.text.strip()
-        except NoSuchElementException:
+        if fields['likes'] is not None:
+            post_data['likes'] = fields['likes']
+        else:
             post_data['likes'] = "0"
 
         post_data['comments'] = "0"
         post_data['shares'] = "0"
 
         # Extract social counts
-        try:
-            dynamic_spans = post.find_elements(By.XPATH, './/span[@aria-hidden="true"]')
-            for span in dynamic_spans:
-                text = span.text.strip().lower()
-                if "comment" in text:
-                    post_data['comments'] = ''.join(filter(str.isdigit, text)) or "0"
-                elif "share" in text or "repost" in text:
-                    post_data['shares'] = ''.join(filter(str.isdigit, text)) or "0"
-        except Exception as e:
-            logger.error(f"Error extracting dynamic social counts: {e}")
+        for text in fields['socials']:
+            text = text.lower()
+            if "comment" in text:
+                m = DIGITS_RE.search(text)
+                post_data['comments'] = m.group(1).replace(',', '') if m else "0"
+            elif "share" in text or "repost" in text:
+                m = DIGITS_RE.search(text)
+                post_data['shares'] = m.group(1).replace(',', '') if m else "0"
 
         # Extract media
-        post_data['image_urls'] = self._extract_media_urls(post, 'img', ['feed-shared-image__image', 'feed-shared-image__img'])
-        post_data['video_urls'] = self._extract_media_urls(post, 'video', ['feed-shared-video__video', 'feed-shared-video__player'])
+        post_data['image_urls'] = fields['imgs']
+        post_data['video_urls'] = fields['videos']
         
         # Extract comments
-        post_data['top_comments'] = self._extract_comments(post)
+        post_data['top_comments'], comments_complete = self._extract_comments(post)
 
         self._print_post_summary(post_data, idx)
-        return post_data
+        return post_data, fields['text'] is not None and comments_complete
 
-    def _extract_media_urls(self, post, element_type: str, class_names: List[str]) -> List[str]:
-        """Helper method to extract media URLs."""
-        urls = []
+    def _extract_comments(self, post) -> Tuple[List[Dict], bool]:
+        """Helper method to extract comments from a post, and whether they finished loading."""
         try:
-            for class_name in class_names:
-                elements = post.find_elements(By.CSS_SELECTOR, f'{element_type}.{class_name}')
-                for element in elements:
-                    src = element.get_attribute('src')
-                    if src and not src.endswith('data:image/gif;base64'):
-                        urls.append(src)
+            comments_button = post.find_element(By.CSS_SELECTOR, COMMENTS_BUTTON_SEL)
         except NoSuchElementException:
-            pass
-        return urls
+            # No comments button means the post has no comments
+            return [], True
 
-    def _extract_comments(self, post) -> List[Dict]:
-        """Helper method to extract comments from a post."""
         try:
-            comments_button = post.find_element(By.XPATH, './/button[contains(@aria-label, "comments")]')
             self.browser.execute_script("arguments[0].click();", comments_button)
-            time.sleep(2)
+            WebDriverWait(post, 5).until(
+                EC.visibility_of_element_located(COMMENT_ITEM_LOCATOR)
+            )
 
             while True:
                 try:
-                    load_more = post.find_element(By.XPATH, './/button[contains(@class, "load-more-comments-button")]')
+                    loaded = len(post.find_elements(*COMMENT_ITEM_LOCATOR))
+                    if loaded >= self.max_comments:
+                        # Enough comments are on the page; anything further would be discarded
+                        break
+                    load_more = post.find_element(By.CSS_SELECTOR, LOAD_MORE_COMMENTS_SEL)
                     self.browser.execute_script("arguments[0].click();", load_more)
-                    time.sleep(1)
-                except NoSuchElementException:
+                    # Wait until the extra comments have been appended
+                    WebDriverWait(post, 5).until(
+                        lambda p: len(p.find_elements(*COMMENT_ITEM_LOCATOR)) > loaded
+                    )
+                except (NoSuchElementException, TimeoutException):
                     break
 
-            comment_blocks = post.find_elements(By.XPATH, './/div[contains(@class, "comments-comment-item")]')[:self.max_comments]
-            extracted_comments = []
-            
-            for comment in comment_blocks:
-                try:
-                    comment_text = comment.find_element(By.CSS_SELECTOR, 'span.comments-comment-item__main-content').text.strip()
-                    try:
-                        like_span = comment.find_element(By.CSS_SELECTOR, 'button.comments-comment-social-bar__reactions-count span')
-                        like_count = like_span.text.strip()
-                    except NoSuchElementException:
-                        like_count = "0"
-                    extracted_comments.append({
-                        'comment_text': comment_text,
-                        'likes': like_count
-                    })
-                except NoSuchElementException:
-                    continue
-            return extracted_comments
-        except NoSuchElementException:
-            return []
+            comments = self.browser.execute_script(
+                "return window.__extractComments(arguments[0], arguments[1]);", post, self.max_comments
+            )
+            return comments, True
+        except TimeoutException:
+            return [], False
+
+    def _get_cached_post(self, urn: Optional[str]) -> Optional[Dict]:
+        """Helper method to look up a post previously scraped with the same comment limit."""
+        if not self.cache or not urn:
+            return None
+        row = self.cache.execute(
+            "SELECT data FROM cached_posts WHERE urn = ? AND max_comments = ?", (urn, self.max_comments)
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def _cache_post(self, urn: Optional[str], post_data: Dict):
+        """Helper method to store a scraped post under its URN and comment limit."""
+        if not self.cache or not urn:
+            return
+        self.cache.execute(
+            "INSERT OR REPLACE INTO cached_posts (urn, max_comments, data) VALUES (?, ?, ?)",
+            (urn, self.max_comments, orjson.dumps(post_data))
+        )
+        self.cache.commit()
 
     def _print_post_summary(self, post_data: Dict, idx: int):
         """Helper method to print post summary."""
@@ -319,57 +503,251 @@ class LinkedInScraper:
         print(f"Top Comments: {len(post_data['top_comments'])}")
         print('-'*40)
 
-    # comment out for now 
-    # code to save posts to a file
-    # def save_posts(self, data: Dict, filename: str):
-    #     """
-    #     Save scraped posts to a JSON file.
+    def save_posts(self, data: Dict, filename: str):
+        """
+        Save scraped posts to a JSON file.
         
-    #     Args:
-    #         data (Dict): Data to save
-    #         filename (str): Name of the file to save to
-    #     """
-    #     with open(filename, "w", encoding="utf-8") as f:
-    #         json.dump(data, f, ensure_ascii=False, indent=2)
-    #     print(f"Data saved to {filename}.")
+        Args:
+            data (Dict): Data to save
+            filename (str): Name of the file to save to
+        """
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        print(f"Data saved to {filename}.")
 
     def close(self):
-        """Close the browser."""
+        """Close the browser and the post cache."""
         if self.browser:
             self.browser.quit()
             self.browser = None
+        self.use_cache(None)
+
+def _open_session(cached: Optional[LinkedInScraper], email: str, password: str, headless: bool) -> Tuple[Optional[LinkedInScraper], bool]:
+    """
+    Return a logged-in scraper for the account, reusing the cached one when it is still valid.
+    
+    Runs on a worker thread, so it never touches the shared session registry; the caller
+    decides what to store or close from the result.
+    
+    Args:
+        cached (Optional[LinkedInScraper]): Session currently cached for (email, headless), if any
+        email (str): LinkedIn login email
+        password (str): LinkedIn login password
+        headless (bool): Whether the browser runs in headless mode
+        
+    Returns:
+        Tuple[Optional[LinkedInScraper], bool]: Logged-in scraper (None if login failed), and whether
+        the cached scraper should be discarded
+    """
+    discard_cached = False
+    if cached is not None and hmac.compare_digest(cached.password.encode(), password.encode()):
+        if cached.is_logged_in():
+            return cached, False
+        # LinkedIn ended this session, so it is dropped whether or not the new login works
+        discard_cached = True
+    
+    # A different password only replaces the cached session once its own login has succeeded
+    scraper = LinkedInScraper(email=email, password=password, headless=headless)
+    if not scraper.login():
+        scraper.close()
+        return None, discard_cached
+    return scraper, cached is not None
+
+def _run_scrape(scraper: LinkedInScraper, request: ScrapeRequest) -> Dict:
+    """
+    Apply a request's settings to a session scraper and scrape, on a worker thread.
+    
+    Opening the post cache can wait on SQLite locks held by batch workers, so it runs here too.
+    
+    Args:
+        scraper (LinkedInScraper): Logged-in session scraper
+        request (ScrapeRequest): Request carrying the company URL and per-request settings
+        
+    Returns:
+        Dict: Result of scrape_company_posts
+    """
+    scraper.num_scrolls = request.num_scrolls
+    scraper.scroll_pause = request.scroll_pause
+    scraper.max_comments = request.max_comments
+    scraper.use_cache(CACHE_PATH if request.use_cache else None)
+    return scraper.scrape_company_posts(request.company_url)
+
+async def _evict_sessions(keep: tuple):
+    """
+    Close idle sessions, then the least recently used ones beyond MAX_SESSIONS.
+    
+    Sessions with a request running or waiting on them are never evicted.
+    
+    Args:
+        keep (tuple): Session key of the incoming request, which is never evicted
+    """
+    now = time.monotonic()
+    idle = [
+        key for key in list(app.state.sessions)
+        if key != keep and not app.state.session_users[key]
+    ]
+    # Count browsers still logging in for active requests, not just the registered sessions
+    live = set(app.state.sessions) | set(app.state.session_users)
+    excess = len(live) - MAX_SESSIONS
+    evicted = []
+    for key in idle:
+        if now - app.state.session_used_at.get(key, now) > SESSION_IDLE_TIMEOUT or len(evicted) < excess:
+            evicted.append(app.state.sessions.pop(key))
+            app.state.session_locks.pop(key, None)
+            app.state.session_used_at.pop(key, None)
+    for scraper in evicted:
+        await asyncio.to_thread(scraper.close)
+
+def _scrape_shard(config: Dict, urls: List[str]) -> List[Dict]:
+    """
+    Scrape a shard of company pages with one browser, inside a batch worker process.
+    
+    Args:
+        config (Dict): Keyword arguments for LinkedInScraper
+        urls (List[str]): Company posts page URLs to scrape
+        
+    Returns:
+        List[Dict]: One result per URL, or a dict with an "error" key if it failed
+    """
+    scraper = LinkedInScraper(**config)
+    try:
+        if not scraper.login():
+            logger.error("Login failed")
+            return [{"source_url": url, "error": "Login failed"} for url in urls]
+        
+        results = []
+        for url in urls:
+            try:
+                results.append(scraper.scrape_company_posts(url))
+            except Exception as e:
+                logger.error(f"Scraping {url} failed with error: {str(e)}")
+                results.append({"source_url": url, "error": str(e)})
+        return results
+    finally:
+        scraper.close()
+
+def _new_worker_pool() -> ProcessPoolExecutor:
+    """Create the process pool used by /scrape_batch."""
+    # Selenium does not play well with threads, so batches fan out to processes
+    return ProcessPoolExecutor(
+        max_workers=BATCH_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
 
 # API Endpoints
+@app.on_event("startup")
+async def startup():
+    # Logged-in browsers are kept alive between requests to skip Chrome start-up and login
+    app.state.sessions = {}
+    app.state.session_used_at = {}
+    # One lock per session: a browser serves one request at a time, other accounts run in parallel
+    app.state.session_locks = defaultdict(asyncio.Lock)
+    # Requests running or waiting on each session, so eviction leaves busy sessions alone
+    app.state.session_users = Counter()
+    app.state.worker_pool = _new_worker_pool()
+
+@app.on_event("shutdown")
+async def shutdown():
+    for scraper in app.state.sessions.values():
+        scraper.close()
+    app.state.sessions.clear()
+    app.state.session_used_at.clear()
+    app.state.session_locks.clear()
+    app.state.worker_pool.shutdown()
+
 @app.post("/scrape")
 async def scrape_linkedin(request: ScrapeRequest):
     logger.info(f"Received scrape request for: {request.company_url}")
     
-    scraper = LinkedInScraper(
-        email=request.email,
-        password=request.password,
-        headless=request.headless,
-        num_scrolls=request.num_scrolls,
-        scroll_pause=request.scroll_pause,
-        max_comments=request.max_comments
-    )
-    
+    # Selenium calls block, so they run in worker threads to keep the event loop serving requests
+    key = (request.email, request.headless)
+    # Register as a user first, so concurrent evictions treat this session as busy
+    app.state.session_users[key] += 1
     try:
-        logger.info("Starting LinkedIn scraping process...")
-        
-        if not scraper.login():
-            logger.error("Login failed")
-            return {"error": "Login failed"}
+        await _evict_sessions(keep=key)
+        return await _scrape_with_session(key, request)
+    finally:
+        app.state.session_users[key] -= 1
+        if not app.state.session_users[key]:
+            del app.state.session_users[key]
+            if key not in app.state.sessions:
+                app.state.session_locks.pop(key, None)
+
+async def _scrape_with_session(key: tuple, request: ScrapeRequest) -> Dict:
+    """Run a /scrape request on the session for `key`, holding that session's lock."""
+    async with app.state.session_locks[key]:
+        try:
+            logger.info("Starting LinkedIn scraping process...")
+            
+            cached = app.state.sessions.get(key)
+            scraper, discard_cached = await asyncio.to_thread(
+                _open_session, cached, request.email, request.password, request.headless
+            )
+            if discard_cached:
+                app.state.sessions.pop(key, None)
+                app.state.session_used_at.pop(key, None)
+                await asyncio.to_thread(cached.close)
+            if scraper is None:
+                logger.error("Login failed")
+                return {"error": "Login failed"}
+            
+            # Re-inserting keeps the registry ordered from least to most recently used
+            app.state.sessions.pop(key, None)
+            app.state.sessions[key] = scraper
+            
+            result = await asyncio.to_thread(_run_scrape, scraper, request)
+            app.state.session_used_at[key] = time.monotonic()
+            logger.info(f"Scraping completed successfully. Found {len(result['posts'])} posts")
+            return {"success": True, "data": result}
         
-        result = scraper.scrape_company_posts(request.company_url)
-        logger.info(f"Scraping completed successfully. Found {len(result['posts'])} posts")
-        return {"success": True, "data": result}
+        except Exception as e:
+            logger.error(f"Scraping failed with error: {str(e)}")
+            # The browser may be in an unknown state, so start fresh next time
+            stale = app.state.sessions.pop(key, None)
+            app.state.session_used_at.pop(key, None)
+            if stale:
+                await asyncio.to_thread(stale.close)
+            return {"error": str(e)}
+
+@app.post("/scrape_batch")
+async def scrape_linkedin_batch(request: BatchScrapeRequest):
+    logger.info(f"Received batch scrape request for {len(request.urls)} companies")
+    
+    config = {
+        "email": request.email,
+        "password": request.password,
+        "headless": request.headless,
+        "num_scrolls": request.num_scrolls,
+        "scroll_pause": request.scroll_pause,
+        "max_comments": request.max_comments,
+        "cache_path": CACHE_PATH if request.use_cache else None
+    }
+    
+    # Split into contiguous shards so the merged results keep the request order
+    shard_size = max(1, (len(request.urls) + BATCH_WORKERS - 1) // BATCH_WORKERS)
+    shards = [request.urls[i:i + shard_size] for i in range(0, len(request.urls), shard_size)]
     
+    loop = asyncio.get_running_loop()
+    pool = app.state.worker_pool
+    try:
+        shard_results = await asyncio.gather(*(
+            loop.run_in_executor(pool, _scrape_shard, config, shard)
+            for shard in shards
+        ))
+    except BrokenProcessPool as e:
+        logger.error(f"Batch worker process died: {str(e)}")
+        # A broken pool rejects all further work, so swap in a fresh one unless another request already did
+        if app.state.worker_pool is pool:
+            app.state.worker_pool = _new_worker_pool()
+            pool.shutdown(wait=False)
+        return {"error": str(e) or "A batch worker process terminated abruptly"}
     except Exception as e:
-        logger.error(f"Scraping failed with error: {str(e)}")
+        logger.error(f"Batch scraping failed with error: {str(e)}")
         return {"error": str(e)}
     
-    finally:
-        scraper.close()
+    results = [result for shard in shard_results for result in shard]
+    logger.info(f"Batch scraping completed for {len(results)} companies")
+    return {"success": True, "data": results}
 
 @app.get("/")
 async def root():